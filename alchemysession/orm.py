@@ -1,7 +1,7 @@
-from typing import Optional, Tuple, Any, Union, TYPE_CHECKING
+from typing import Optional, Tuple, Any, Union, Iterator, Type, TYPE_CHECKING
 import datetime
 
-from sqlalchemy import orm
+from sqlalchemy import orm, and_, or_, select
 
 from telethon.sessions.memory import MemorySession, _SentFileType
 from telethon import utils
@@ -11,6 +11,11 @@ from telethon.tl.types import InputPhoto, InputDocument, PeerUser, PeerChat, Pee
 if TYPE_CHECKING:
     from .sqlalchemy import AlchemySessionContainer
 
+# Marked IDs of channels are -(1000000000000 + channel_id), see telethon.utils.get_peer_id
+CHANNEL_ID_OFFSET = -1000000000000
+
+EntityKind = Type[Union[PeerUser, PeerChat, PeerChannel]]
+
 
 class AlchemySession(MemorySession):
     def __init__(self, container: 'AlchemySessionContainer', session_id: str) -> None:
@@ -135,6 +140,64 @@ class AlchemySession(MemorySession):
         row = query.one_or_none()
         return (row.id, row.hash) if row else None
 
+    @staticmethod
+    def _entity_kind_condition(id_column: Any, kind: EntityKind) -> Any:
+        if kind is PeerUser:
+            return id_column > 0
+        elif kind is PeerChat:
+            return and_(id_column < 0, id_column > CHANNEL_ID_OFFSET)
+        elif kind is PeerChannel:
+            return id_column < CHANNEL_ID_OFFSET
+        raise TypeError("Unknown entity kind {}".format(kind))
+
+    @staticmethod
+    def _after_key(key_columns: Tuple[Any, ...], key: Tuple[Any, ...]) -> Any:
+        # Expanded form of (a, b, c) > (x, y, z), row values aren't supported everywhere.
+        condition = key_columns[-1] > key[-1]
+        for column, value in reversed(list(zip(key_columns[:-1], key[:-1]))):
+            condition = or_(column > value, and_(column == value, condition))
+        return condition
+
+    def _iter_pages(self, query: Any, key_columns: Tuple[Any, ...], chunk_size: int
+                    ) -> Iterator[Tuple]:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1, got {}".format(chunk_size))
+
+        def pages() -> Iterator[Tuple]:
+            # Keyset pagination: every chunk is a separate short query starting after the
+            # last key of the previous one, so no cursor or connection is held between yields.
+            key = None
+            while True:
+                page = query if key is None else query.where(self._after_key(key_columns, key))
+                rows = self.engine.execute(page.order_by(*key_columns).limit(chunk_size)
+                                           ).fetchall()
+                for row in rows:
+                    yield tuple(row)
+                if len(rows) < chunk_size:
+                    return
+                key = tuple(rows[-1])[:len(key_columns)]
+
+        return pages()
+
+    def iter_entities(self, kind: Optional[EntityKind] = None, chunk_size: int = 1000
+                      ) -> Iterator[Tuple[int, int, Optional[str], Optional[int], Optional[str]]]:
+        """Iterate over the (id, hash, username, phone, name) rows of this session's entities."""
+        t = self.Entity.__table__
+        condition = t.c.session_id == self.session_id
+        if kind:
+            condition = and_(condition, self._entity_kind_condition(t.c.id, kind))
+        return self._iter_pages(select([t.c.id, t.c.hash, t.c.username, t.c.phone, t.c.name])
+                                .where(condition), (t.c.id,), chunk_size)
+
+    def iter_sent_files(self, chunk_size: int = 1000
+                        ) -> Iterator[Tuple[bytes, int, int, int, int]]:
+        """Iterate over the (md5_digest, file_size, type, id, hash) rows of sent files."""
+        t = self.SentFile.__table__
+        return self._iter_pages(select([t.c.md5_digest, t.c.file_size, t.c.type, t.c.id,
+                                        t.c.hash])
+                                .where(t.c.session_id == self.session_id),
+                                (t.c.md5_digest, t.c.file_size, t.c.type), chunk_size)
+
     def get_file(self, md5_digest: str, file_size: int, cls: Any) -> Optional[Tuple[int, int]]:
         row = self._db_query(self.SentFile,
                              self.SentFile.md5_digest == md5_digest,